@@ -1,15 +1,48 @@
 """LessonsAgent package public API."""
 
-from .agent import ResearchAgentConfig, ResearchNotes, run_research_agent
-from .pipeline import LessonGenerationConfig, LessonGenerationResult, generate_lessons
-from .schemas import (
-    ContentBlock,
-    LessonPlan,
-    LessonPlanBundle,
-    LessonSection,
-    ReferenceResource,
-    SourceCitation,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .agent import ResearchAgentConfig, ResearchNotes, run_research_agent
+    from .pipeline import LessonGenerationConfig, LessonGenerationResult, generate_lessons
+    from .schemas import (
+        ContentBlock,
+        LessonPlan,
+        LessonPlanBundle,
+        LessonSection,
+        ReferenceResource,
+        SourceCitation,
+    )
+
+# Public names are resolved on first access so that importing a submodule such as
+# ``lessons_agent.cli`` does not pull in LangGraph/LangChain up front.
+_LAZY_EXPORTS = {
+    "ContentBlock": ".schemas",
+    "LessonPlan": ".schemas",
+    "LessonPlanBundle": ".schemas",
+    "LessonSection": ".schemas",
+    "ReferenceResource": ".schemas",
+    "SourceCitation": ".schemas",
+    "ResearchNotes": ".agent",
+    "ResearchAgentConfig": ".agent",
+    "run_research_agent": ".agent",
+    "LessonGenerationConfig": ".pipeline",
+    "LessonGenerationResult": ".pipeline",
+    "generate_lessons": ".pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "ContentBlock",
@@ -25,4 +58,3 @@ __all__ = [
     "LessonGenerationResult",
     "generate_lessons",
 ]
-
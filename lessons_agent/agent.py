@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -20,7 +21,7 @@ from lessons_agent.tools import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchAgentConfig:
     """Configuration for a single research run."""
 
@@ -32,7 +33,7 @@ class ResearchAgentConfig:
     overrides: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchEntry:
     """Single research note entry produced by the agent."""
 
@@ -40,7 +41,7 @@ class ResearchEntry:
     citations: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchNotes:
     """Aggregated research notes for downstream synthesis."""
 
@@ -49,6 +50,14 @@ class ResearchNotes:
     audience: str
     entries: List[ResearchEntry] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Level/audience repeat across every lesson built from these notes. sys.intern
+        # only takes exact str, so subclasses and other values are kept as given.
+        if type(self.level) is str:
+            self.level = sys.intern(self.level)
+        if type(self.audience) is str:
+            self.audience = sys.intern(self.audience)
+
     def add_entry(self, content: str, citations: Optional[List[str]] = None) -> None:
         self.entries.append(
             ResearchEntry(content=content, citations=citations or []),
@@ -172,10 +181,13 @@ def _fallback_research_summary(config: ResearchAgentConfig) -> tuple[str, List[s
     return content, citations
 
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
 def _clean_fallback_snippet(snippet: str) -> str:
     """Normalize snippets so they read like polished teaching notes."""
 
-    snippet = re.sub(r"\s+", " ", snippet).strip()
+    snippet = WHITESPACE_PATTERN.sub(" ", snippet).strip()
     if not snippet:
         return ""
     snippet = snippet.replace("TODO:", "").strip()
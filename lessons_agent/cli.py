@@ -6,22 +6,13 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import Callable, List, Sequence
-
-from lessons_agent.agent import ResearchNotes
-from lessons_agent.pipeline import (
-    LessonGenerationConfig,
-    LessonGenerationResult,
-    generate_lessons_to_disk,
-)
-from lessons_agent.schemas import (
-    ContentBlock,
-    LessonPlan,
-    LessonPlanBundle,
-    LessonSection,
-)
-from lessons_agent.output import LessonFileInfo, write_lessons_to_directory
-from lessons_agent.monitoring import configure_logging
+from typing import TYPE_CHECKING, Callable, List, Sequence
+
+# The LLM/agent stack is imported inside the command handlers so that ``--help``
+# and argument errors return without loading LangGraph, LangChain, or Pydantic.
+if TYPE_CHECKING:  # pragma: no cover
+    from lessons_agent.output import LessonFileInfo
+    from lessons_agent.pipeline import LessonGenerationConfig, LessonGenerationResult
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -67,6 +58,10 @@ def _build_parser() -> argparse.ArgumentParser:
 
 
 def _mock_generation_result(config: LessonGenerationConfig) -> LessonGenerationResult:
+    from lessons_agent.agent import ResearchNotes
+    from lessons_agent.pipeline import LessonGenerationResult
+    from lessons_agent.schemas import ContentBlock, LessonPlan, LessonPlanBundle, LessonSection
+
     notes = ResearchNotes(topic=config.topic, level=config.level, audience=config.audience)
     notes.add_entry(
         f"Mock research notes for {config.topic}. Include citations.",
@@ -107,8 +102,12 @@ def _run_generation(
     mock_run: bool,
 ) -> List[LessonFileInfo]:
     if mock_run:
+        from lessons_agent.output import write_lessons_to_directory
+
         result = _mock_generation_result(config)
         return write_lessons_to_directory(result, output_dir)
+    from lessons_agent.pipeline import generate_lessons_to_disk
+
     return generate_lessons_to_disk(config, output_dir=output_dir)
 
 
@@ -117,6 +116,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "generate-lessons":
+        from lessons_agent.monitoring import configure_logging
+        from lessons_agent.pipeline import LessonGenerationConfig
+
         configure_logging(level=logging.DEBUG if args.verbose else logging.INFO)
         config = LessonGenerationConfig(
             topic=args.topic,
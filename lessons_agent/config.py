@@ -32,10 +32,18 @@ def get_llm_settings() -> LLMSettings:
     return LLMSettings()
 
 
+@lru_cache(maxsize=1)
+def get_llm_settings_dict() -> Dict[str, Any]:
+    """Return the cached settings as a dict; callers must copy before mutating."""
+
+    return get_llm_settings().model_dump()
+
+
 def reload_llm_settings() -> LLMSettings:
     """Clear cached settings and reload from the environment."""
 
     get_llm_settings.cache_clear()  # type: ignore[attr-defined]
+    get_llm_settings_dict.cache_clear()  # type: ignore[attr-defined]
     return get_llm_settings()
 
 
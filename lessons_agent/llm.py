@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Optional, Type
 
 from dotenv import load_dotenv
@@ -10,9 +11,8 @@ from langchain_core.runnables import Runnable
 from pydantic import BaseModel
 
 from lessons_agent.config import (
-    LLMSettings,
     ResolvedLLMConfig,
-    get_llm_settings,
+    get_llm_settings_dict,
     reload_llm_settings,
     to_overrides_dict,
 )
@@ -26,24 +26,51 @@ def _merge_llm_config(
 ) -> ResolvedLLMConfig:
     """Combine env/default settings with ad-hoc overrides."""
 
-    settings: LLMSettings = get_llm_settings()
-    merged = settings.model_dump()
+    merged = dict(get_llm_settings_dict())
     merged.update(to_overrides_dict(overrides))
     return ResolvedLLMConfig(**merged)
 
 
+@lru_cache(maxsize=8)
+def _cached_chat_model(
+    model_name: str,
+    use_openai: bool,
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+) -> BaseChatModel:
+    """Build (once per distinct configuration) a chat model via the Holistic AI helper."""
+
+    return get_chat_model(
+        model_name=model_name,
+        use_openai=use_openai,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+    )
+
+
+def clear_chat_model_cache() -> None:
+    """Drop memoized chat models, e.g. after credentials change."""
+
+    _cached_chat_model.cache_clear()
+
+
 def get_default_chat_model(
     *, overrides: Optional[Dict[str, Any]] = None
 ) -> BaseChatModel:
-    """Instantiate the default chat model with optional runtime overrides."""
+    """Return the default chat model with optional runtime overrides.
+
+    Instances are shared across calls with the same resolved configuration.
+    """
 
     config = _merge_llm_config(overrides)
-    return get_chat_model(
-        model_name=config.model_name,
-        use_openai=config.use_openai,
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-        timeout=config.timeout,
+    return _cached_chat_model(
+        config.model_name,
+        config.use_openai,
+        config.temperature,
+        config.max_tokens,
+        config.timeout,
     )
 
 
@@ -59,6 +86,7 @@ def get_structured_output_model(
 
 
 __all__ = [
+    "clear_chat_model_cache",
     "get_default_chat_model",
     "get_structured_output_model",
     "reload_llm_settings",
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Iterable
 
 from lessons_agent.schemas import LessonPlanBundle
+from lessons_agent.serialization import dumps_str
 
 LOGGER_NAME = "lessons_agent"
 
@@ -34,8 +34,10 @@ LOGGER = configure_logging()
 def log_event(event_type: str, **metadata: Any) -> None:
     """Log a structured monitoring event."""
 
+    if not LOGGER.isEnabledFor(logging.INFO):
+        return
     payload = {"event": event_type, **metadata}
-    LOGGER.info("%s", json.dumps(payload, default=str))
+    LOGGER.info("%s", dumps_str(payload, default=str))
 
 
 def validate_lesson_bundle(bundle: LessonPlanBundle) -> None:
@@ -47,9 +49,12 @@ def validate_lesson_bundle(bundle: LessonPlanBundle) -> None:
     for idx, lesson in enumerate(bundle.lessons, start=1):
         if not lesson.sources:
             raise ValueError(f"Lesson {idx} is missing citations/sources.")
-        for section in lesson.sections:
-            if not section.content_blocks:
-                raise ValueError(f"Lesson {idx} contains an empty section {section.title}.")
+        empty_section = next(
+            (section for section in lesson.sections if not section.content_blocks),
+            None,
+        )
+        if empty_section is not None:
+            raise ValueError(f"Lesson {idx} contains an empty section {empty_section.title}.")
 
 
 __all__ = ["configure_logging", "log_event", "validate_lesson_bundle", "LOGGER"]
@@ -2,28 +2,48 @@
 
 from __future__ import annotations
 
-import json
+import re
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List
+
+from lessons_agent.serialization import dump_model, dumps
 
 if TYPE_CHECKING:  # pragma: no cover
     from lessons_agent.pipeline import LessonGenerationResult
 
 
+class _SlugTable(dict):
+    """Translation table lowercasing alphanumerics per character and mapping the rest to ``-``.
+
+    Lowercasing each character on its own (rather than the translated string) keeps the
+    context-free rules, e.g. no Greek final-sigma substitution. Filled lazily.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        mapped = char.lower() if char.isalnum() else "-"
+        self[codepoint] = mapped
+        return mapped
+
+
+_SLUG_TABLE = _SlugTable()
+_DASH_RUN_PATTERN = re.compile(r"-{2,}")
+
+
 def _slugify(value: str) -> str:
-    slug = "".join(ch.lower() if ch.isalnum() else "-" for ch in value)
-    slug = "-".join(filter(None, slug.split("-")))
+    slug = value.translate(_SLUG_TABLE)
+    slug = _DASH_RUN_PATTERN.sub("-", slug).strip("-")
     return slug or "lesson"
 
 
-def _timestamp() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y%m%d-%H%M%S")
 
 
-@dataclass
+@dataclass(slots=True)
 class LessonFileInfo:
     path: Path
     lesson_id: str
@@ -36,35 +56,38 @@ def write_lessons_to_directory(
 ) -> List[LessonFileInfo]:
     output_dir.mkdir(parents=True, exist_ok=True)
     topic_slug = _slugify(result.bundle.topic)
-    timestamp = _timestamp()
+    generated_at = datetime.now(timezone.utc)
+    timestamp = _timestamp(generated_at)
     infos: List[LessonFileInfo] = []
+    # Bundles may repeat the same LessonPlan instance (e.g. mock runs); serialize each once.
+    serialized: Dict[int, bytes] = {}
 
     for idx, lesson in enumerate(result.bundle.lessons, start=1):
         lesson_id = lesson.topic or f"{topic_slug}-{uuid.uuid4().hex[:8]}"
         filename = f"{topic_slug}-lesson-{idx:02d}-{timestamp}.json"
         path = output_dir / filename
-        path.write_text(
-            json.dumps(lesson.model_dump(mode="json"), indent=2),
-            encoding="utf-8",
-        )
+        payload = serialized.get(id(lesson))
+        if payload is None:
+            payload = serialized[id(lesson)] = dump_model(lesson, indent=True)
+        path.write_bytes(payload)
         infos.append(LessonFileInfo(path=path, lesson_id=lesson_id, lesson_index=idx))
 
     index_payload = {
         "topic": result.bundle.topic,
         "level": result.bundle.level,
         "audience": result.bundle.audience,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at.isoformat(),
         "lessons": [
             {
                 "lesson_index": info.lesson_index,
                 "file": info.path.name,
-                "lesson_topic": result.bundle.lessons[info.lesson_index - 1].topic,
+                "lesson_topic": lesson.topic,
             }
-            for info in infos
+            for info, lesson in zip(infos, result.bundle.lessons)
         ],
     }
     index_path = output_dir / f"{topic_slug}-index-{timestamp}.json"
-    index_path.write_text(json.dumps(index_payload, indent=2), encoding="utf-8")
+    index_path.write_bytes(dumps(index_payload, indent=True))
 
     return infos
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 from lessons_agent.agent import ResearchAgentConfig, ResearchNotes, run_research_agent
 from lessons_agent.monitoring import log_event, validate_lesson_bundle
@@ -19,6 +21,7 @@ from lessons_agent.schemas import (
     ReferenceResource,
     SourceCitation,
 )
+from lessons_agent.serialization import dumps
 from lessons_agent.structured_output import get_lesson_plan_bundle_model
 from lessons_agent.tools import ValyuSearchClient
 
@@ -33,6 +36,14 @@ class LessonGenerationConfig:
     num_lessons: int = 2
     goals: str = "Create comprehensive lesson plans."
     estimated_duration_minutes: int = 45
+    # When set, a retry is dispatched this many seconds into a still-running synthesis
+    # attempt instead of after it fails. Off by default: it usually doubles provider calls.
+    # The losing attempt is left running on a daemon thread, so it never delays exit.
+    speculative_retry_after_seconds: Optional[float] = None
+    # When True, the image-enrichment search starts alongside research instead of after
+    # synthesis. It then always runs (one paid Valyu call), even if synthesis already
+    # supplied an image for every section. Off by default.
+    prefetch_image_search: bool = False
 
 
 @dataclass
@@ -43,7 +54,7 @@ class LessonGenerationResult:
     bundle: LessonPlanBundle
 
 
-SCHEMA_JSON = json.dumps(LessonPlanBundle.model_json_schema(), indent=2)
+SCHEMA_JSON = dumps(LessonPlanBundle.model_json_schema(), indent=True).decode("utf-8")
 
 
 SYNTHESIS_INSTRUCTIONS = """
@@ -74,18 +85,29 @@ Exact JSON schema (reference only, do not paraphrase field names):
 {schema}
 """.strip().format(schema=SCHEMA_JSON)
 
+# All request-invariant text lives in this prefix so prefix-caching providers can reuse
+# it; per-request fields, research notes, and retry notes are only ever appended after.
+SYNTHESIS_PROMPT_PREFIX = (
+    f"{SYNTHESIS_INSTRUCTIONS}\n\n"
+    "Writing style: slide-ready, instructor-facing, no references to research tools or search engines.\n"
+    "Visual guidance: each section should describe at least one compelling visual that aids teaching.\n\n"
+)
+
 
 def _build_synthesis_prompt(config: LessonGenerationConfig, notes: ResearchNotes) -> str:
+    lesson_outline = "\n".join(
+        f"- Lesson {idx} of {config.num_lessons}" for idx in range(1, config.num_lessons + 1)
+    )
     return (
-        f"{SYNTHESIS_INSTRUCTIONS}\n\n"
+        f"{SYNTHESIS_PROMPT_PREFIX}"
         f"Topic: {config.topic}\n"
         f"Learner level: {config.level}\n"
         f"Audience: {config.audience}\n"
         f"Target number of lessons: {config.num_lessons}\n"
+        "Return every lesson below in the `lessons` list of this single response:\n"
+        f"{lesson_outline}\n"
         f"Estimated duration minutes: {config.estimated_duration_minutes}\n"
-        f"Goals: {config.goals}\n"
-        "Writing style: slide-ready, instructor-facing, no references to research tools or search engines.\n"
-        "Visual guidance: each section should describe at least one compelling visual that aids teaching.\n\n"
+        f"Goals: {config.goals}\n\n"
         f"Research Notes:\n"
         f"{notes.as_markdown()}\n"
     )
@@ -105,17 +127,30 @@ def generate_lessons(
         audience=config.audience,
         goals=config.goals,
     )
+    # The image search only depends on the topic, so it can overlap research + synthesis.
+    image_results = (
+        _prefetch_image_results(
+            enrichment_topic=config.topic,
+            max_results=max(config.num_lessons * 4, 4),
+        )
+        if config.prefetch_image_search
+        else None
+    )
     notes = research_runner(research_config)
     log_event("lesson_synthesis_start", topic=config.topic, notes_entries=len(notes.entries))
     synthesis = structured_runner or get_lesson_plan_bundle_model()
     prompt = _build_synthesis_prompt(config, notes)
     bundle = None
     try:
-        bundle = _invoke_synthesis_with_retries(synthesis, prompt)
+        bundle = _invoke_synthesis_with_retries(
+            synthesis,
+            prompt,
+            speculative_after=config.speculative_retry_after_seconds,
+        )
     except ValueError as exc:
         log_event("lesson_synthesis_error", error=str(exc))
         bundle = _build_fallback_bundle(config, notes)
-    _ensure_image_blocks(bundle, enrichment_topic=config.topic)
+    _ensure_image_blocks(bundle, enrichment_topic=config.topic, prefetched=image_results)
     _normalize_bundle(bundle, topic=config.topic)
     validate_lesson_bundle(bundle)
     log_event("lesson_synthesis_complete", lessons=len(bundle.lessons))
@@ -142,19 +177,50 @@ def generate_lessons_to_disk(
     return infos
 
 
+def _submit_daemon(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+    """Run ``fn`` on a daemon thread and expose its outcome as a Future.
+
+    Unlike ``ThreadPoolExecutor`` workers, which the interpreter joins at exit, an
+    abandoned call here cannot keep the CLI alive until the provider times out.
+    """
+
+    future: "Future[Any]" = Future()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:  # noqa: BLE001 - surfaced through future.result()
+            future.set_exception(exc)
+
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
 def _invoke_synthesis_with_retries(
     synthesis_runnable,
     prompt: str,
     *,
     max_attempts: int = 2,
+    speculative_after: Optional[float] = None,
 ) -> LessonPlanBundle:
-    """Invoke structured synthesis with retries before falling back."""
+    """Invoke structured synthesis with retries before falling back.
+
+    With ``speculative_after``, each retry is launched once the previous attempt has run
+    that many seconds (or failed), and the first successful attempt wins.
+    """
 
     last_error: Optional[ValueError] = None
     retry_note = (
         "\n\nSTRICT SCHEMA REMINDER: Respond with a single JSON object that matches the provided schema. "
         "Do not omit the `lessons` list and do not add commentary outside the JSON."
     )
+    if speculative_after is not None and max_attempts > 1:
+        prompts = [prompt + retry_note * attempt for attempt in range(max_attempts)]
+        return _invoke_synthesis_speculatively(
+            synthesis_runnable, prompts, delay=speculative_after
+        )
     for attempt in range(max_attempts):
         try:
             return synthesis_runnable.invoke(prompt)
@@ -166,6 +232,37 @@ def _invoke_synthesis_with_retries(
     raise ValueError("Structured synthesis failed without raising a specific error.")
 
 
+def _invoke_synthesis_speculatively(
+    synthesis_runnable,
+    prompts: Sequence[str],
+    *,
+    delay: float,
+) -> LessonPlanBundle:
+    """Stagger synthesis attempts over ``prompts`` and return the first success."""
+
+    last_error: Optional[ValueError] = None
+    queued = iter(prompts)
+    pending = {_submit_daemon(synthesis_runnable.invoke, next(queued))}
+    next_prompt = next(queued, None)
+    while pending:
+        # Once every attempt is running there is nothing left to stagger, so block.
+        timeout = delay if next_prompt is not None else None
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                # Losing attempts keep running on daemon threads and are simply dropped.
+                return future.result()
+            except ValueError as exc:
+                last_error = exc
+        # Either the running attempts are slow or one just failed: start the next one.
+        if next_prompt is not None:
+            pending.add(_submit_daemon(synthesis_runnable.invoke, next_prompt))
+            next_prompt = next(queued, None)
+    if last_error:
+        raise last_error
+    raise ValueError("Structured synthesis failed without raising a specific error.")
+
+
 def _build_fallback_bundle(
     config: LessonGenerationConfig,
     notes: ResearchNotes,
@@ -252,29 +349,61 @@ def _build_fallback_bundle(
     )
 
 
-def _ensure_image_blocks(bundle: LessonPlanBundle, *, enrichment_topic: str) -> None:
-    """Guarantee that every section includes at least one image block."""
-
-    sections_missing_images: List[LessonSection] = []
-    for lesson in bundle.lessons:
-        for section in lesson.sections:
-            if not any(block.type == "image" for block in section.content_blocks):
-                sections_missing_images.append(section)
-    if not sections_missing_images:
-        return
+def _prefetch_image_results(
+    *,
+    enrichment_topic: str,
+    max_results: int,
+) -> Optional["Future[List[Dict[str, Any]]]"]:
+    """Start the image-enrichment search in the background, if search is configured."""
 
     try:
         client = ValyuSearchClient.from_env()
-    except Exception as exc:  # pragma: no cover - defensive
-        log_event("image_enrichment_skipped", reason=str(exc))
+    except Exception:  # pragma: no cover - defensive; reported by _ensure_image_blocks
+        return None
+    return _submit_daemon(
+        client.search,
+        query=f"{enrichment_topic} visuals for instruction",
+        max_results=max_results,
+    )
+
+
+def _ensure_image_blocks(
+    bundle: LessonPlanBundle,
+    *,
+    enrichment_topic: str,
+    prefetched: Optional["Future[List[Dict[str, Any]]]"] = None,
+) -> None:
+    """Guarantee that every section includes at least one image block.
+
+    ``prefetched`` is a search started by ``_prefetch_image_results``; it is only waited
+    on when a section lacks an image, but its request has been sent either way. When
+    omitted, the search is issued here on demand.
+    """
+
+    sections_missing_images: List[LessonSection] = [
+        section
+        for lesson in bundle.lessons
+        for section in lesson.sections
+        if not any(block.type == "image" for block in section.content_blocks)
+    ]
+    if not sections_missing_images:
         return
 
-    max_results = max(len(sections_missing_images) * 2, 4)
+    if prefetched is None:
+        try:
+            client = ValyuSearchClient.from_env()
+        except Exception as exc:  # pragma: no cover - defensive
+            log_event("image_enrichment_skipped", reason=str(exc))
+            return
+
     try:
-        results = client.search(
-            query=f"{enrichment_topic} visuals for instruction",
-            max_results=max_results,
-        )
+        if prefetched is not None:
+            results = prefetched.result()
+        else:
+            results = client.search(
+                query=f"{enrichment_topic} visuals for instruction",
+                max_results=max(len(sections_missing_images) * 2, 4),
+            )
     except Exception as exc:  # pragma: no cover - defensive
         log_event("image_enrichment_failed", error=str(exc))
         return
@@ -289,6 +418,9 @@ def _ensure_image_blocks(bundle: LessonPlanBundle, *, enrichment_topic: str) ->
             section.content_blocks.append(block)
 
 
+IMAGE_URL_KEYS = ("image_url", "thumbnail_url", "url")
+
+
 def _build_image_block_from_result(item: Optional[dict], topic: str) -> Optional[ContentBlock]:
     """Convert a Valyu search result into an image content block."""
 
@@ -301,12 +433,14 @@ def _build_image_block_from_result(item: Optional[dict], topic: str) -> Optional
         prompt_hint = f"Illustrate the central idea behind {topic}."
     title = item.get("title") or topic
     prompt = f"Slide illustration for {title}: {prompt_hint}"
-    image_url = item.get("image_url") or item.get("thumbnail_url") or item.get("url")
-    if image_url and isinstance(image_url, str):
-        if not image_url.startswith(("http://", "https://")):
-            image_url = None
-    else:
-        image_url = None
+    image_url = next(
+        (
+            value
+            for value in map(item.get, IMAGE_URL_KEYS)
+            if isinstance(value, str) and value.startswith(("http://", "https://"))
+        ),
+        None,
+    )
     return ContentBlock(
         type="image",
         image_prompt=prompt[:500],
@@ -334,7 +468,6 @@ def _normalize_bundle(bundle: LessonPlanBundle, *, topic: str) -> None:
                 [_strip_navigation_tokens(point) for point in section.key_points],
                 fallback=[f"Summarize how to apply {topic} in production."],
             )
-            polished_blocks: List[ContentBlock] = []
             for block in section.content_blocks:
                 if block.type == "text" and block.text:
                     block.text = _polish_text(block.text, max_sentences=6)
@@ -346,8 +479,9 @@ def _normalize_bundle(bundle: LessonPlanBundle, *, topic: str) -> None:
                     block.image_caption = (
                         _trim_caption(block.image_caption or section.title)
                     )
-                polished_blocks.append(block)
-            section.content_blocks = polished_blocks
+    # The memoized cleaners only pay off within a bundle; don't retain text across runs.
+    _clean_summary_text.cache_clear()
+    _strip_navigation_tokens.cache_clear()
 
 
 def _ensure_list(items: Sequence[str], *, fallback: List[str]) -> List[str]:
@@ -355,7 +489,7 @@ def _ensure_list(items: Sequence[str], *, fallback: List[str]) -> List[str]:
     return values or fallback
 
 
-NAVIGATION_STOPWORDS = {
+NAVIGATION_STOPWORDS = frozenset({
     "home",
     "pricing",
     "docs",
@@ -371,32 +505,47 @@ NAVIGATION_STOPWORDS = {
     "demo",
     "request",
     "back",
-}
+})
 
-MARKDOWN_TOKEN_PATTERN = re.compile(r"[*_`#]+")
 PARENS_LINK_PATTERN = re.compile(r"\[(?P<label>[^\]]+)\]\((?P<url>[^)]+)\)")
 MULTI_SPACE_PATTERN = re.compile(r"\s{2,}")
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+# Drops markdown tokens and normalizes bullets/dashes in a single C-level pass.
+SNIPPET_TRANSLATION = str.maketrans(
+    {"*": None, "_": None, "`": None, "#": None, "•": " ", "–": " - ", "—": " - "}
+)
+
+
+class _AlphaOnlyTable(dict):
+    """Translation table that deletes non-alphabetic code points, filled lazily."""
 
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        mapped = codepoint if chr(codepoint).isalpha() else None
+        self[codepoint] = mapped
+        return mapped
 
+
+_ALPHA_ONLY_TABLE = _AlphaOnlyTable()
+
+
+@lru_cache(maxsize=512)
 def _clean_summary_text(text: str, *, max_sentences: int = 5) -> str:
     """Collapse noisy snippets into tidy paragraphs suitable for lessons."""
 
     if not text:
         return ""
     stripped = PARENS_LINK_PATTERN.sub(r"\g<label>", text)
-    stripped = MARKDOWN_TOKEN_PATTERN.sub("", stripped)
-    stripped = stripped.replace("•", " ").replace("–", " - ").replace("—", " - ")
+    stripped = stripped.translate(SNIPPET_TRANSLATION)
     stripped = MULTI_SPACE_PATTERN.sub(" ", stripped)
-    fragments = re.split(r"(?<=[.!?])\s+|\n+", stripped)
     cleaned_fragments: List[str] = []
-    for fragment in fragments:
+    for fragment in _iter_sentence_fragments(stripped):
         candidate = _strip_navigation_tokens(fragment)
         candidate = candidate.strip(" -")
         if not candidate:
             continue
         if len(candidate) < 30:
             continue
-        alpha_ratio = sum(c.isalpha() for c in candidate) / max(len(candidate), 1)
+        alpha_ratio = len(candidate.translate(_ALPHA_ONLY_TABLE)) / max(len(candidate), 1)
         if alpha_ratio < 0.4:
             continue
         cleaned_fragments.append(candidate)
@@ -408,6 +557,17 @@ def _clean_summary_text(text: str, *, max_sentences: int = 5) -> str:
     return combined
 
 
+def _iter_sentence_fragments(text: str) -> Iterator[str]:
+    """Lazily yield the pieces ``SENTENCE_BOUNDARY_PATTERN.split(text)`` would return."""
+
+    start = 0
+    for match in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    yield text[start:]
+
+
+@lru_cache(maxsize=1024)
 def _strip_navigation_tokens(text: str) -> str:
     tokens = text.split()
     filtered = [
@@ -1,5 +1,7 @@
 """Prompt templates used by the ReAct research agent."""
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 RESEARCH_SYSTEM_PROMPT = (
@@ -23,8 +25,13 @@ RESEARCH_HUMAN_TEMPLATE = (
 )
 
 
+@lru_cache(maxsize=1)
 def build_research_prompt() -> ChatPromptTemplate:
-    """Return the ReAct prompt template used by the research agent."""
+    """Return the shared ReAct prompt template used by the research agent.
+
+    The template is cached; specialize it with ``.partial(...)``, which returns a
+    new template, rather than mutating the returned instance.
+    """
 
     return ChatPromptTemplate.from_messages(
         [
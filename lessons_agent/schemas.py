@@ -1,14 +1,41 @@
 """Pydantic data models for lesson-plan generation."""
 
-from typing import List, Literal, Optional
-
-from pydantic import BaseModel, Field, HttpUrl, PositiveInt, ValidationInfo, field_validator
+import sys
+from typing import Annotated, List, Literal, Optional
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    PositiveInt,
+    field_validator,
+    model_validator,
+)
 
 LearnerLevel = Literal["beginner", "intermediate", "advanced"]
 ContentBlockType = Literal["text", "image"]
 ResourceType = Literal["article", "video", "paper", "book", "documentation", "other"]
 
 
+def _intern_label(value):
+    """Intern exact ``str`` labels that repeat across every lesson in a bundle."""
+
+    return sys.intern(value) if type(value) is str else value
+
+
+# Level/audience strings shared by a bundle and all of its lessons.
+SharedLevel = Annotated[LearnerLevel, AfterValidator(_intern_label)]
+SharedLabel = Annotated[str, AfterValidator(_intern_label)]
+
+
+def _http_url_or_none(value):
+    """Keep http(s) URL strings as-is; anything else becomes ``None``."""
+
+    if isinstance(value, str) and value.startswith(("http://", "https://")):
+        return value
+    return None
+
+
 class ContentBlock(BaseModel):
     """A content block inside a lesson section."""
 
@@ -25,24 +52,25 @@ class ContentBlock(BaseModel):
         default=None,
         description="Suggested caption for the image block.",
     )
-    image_url: Optional[HttpUrl] = Field(
+    image_url: Optional[str] = Field(
         default=None,
         description="Optional remote asset URL for the generated or fetched image.",
     )
 
-    @field_validator("text", mode="after")
-    def validate_text(cls, value, info: ValidationInfo):  # type: ignore[override]
-        content_type = info.data.get("type")
-        if content_type == "text" and not value:
-            raise ValueError("Text content blocks must include non-empty text.")
-        return value
-
-    @field_validator("image_prompt", mode="after")
-    def validate_image_prompt(cls, value, info: ValidationInfo):  # type: ignore[override]
-        content_type = info.data.get("type")
-        if content_type == "image" and not value:
+    @field_validator("image_url", mode="before")
+    def validate_image_url(cls, value):  # type: ignore[override]
+        return _http_url_or_none(value)
+
+    @model_validator(mode="after")
+    def validate_payload(self):  # type: ignore[override]
+        # Only explicitly supplied fields are checked, matching field-level validation
+        # which skips omitted defaults.
+        if self.type == "text":
+            if not self.text and "text" in self.model_fields_set:
+                raise ValueError("Text content blocks must include non-empty text.")
+        elif not self.image_prompt and "image_prompt" in self.model_fields_set:
             raise ValueError("Image content blocks must include an image_prompt.")
-        return value
+        return self
 
 
 class ReferenceResource(BaseModel):
@@ -50,13 +78,17 @@ class ReferenceResource(BaseModel):
 
     title: str = Field(..., description="Resource title.")
     type: ResourceType = Field(..., description="Resource format/category.")
-    url: Optional[HttpUrl] = Field(
+    url: Optional[str] = Field(
         default=None, description="Optional URL pointing to the resource."
     )
     notes: Optional[str] = Field(
         default=None, description="Context on when/how to use the resource."
     )
 
+    @field_validator("url", mode="before")
+    def validate_url(cls, value):  # type: ignore[override]
+        return _http_url_or_none(value)
+
 
 class SourceCitation(BaseModel):
     """Metadata about a source consulted during research."""
@@ -90,8 +122,8 @@ class LessonPlan(BaseModel):
     """Complete lesson definition with pedagogical structure."""
 
     topic: str
-    level: LearnerLevel
-    audience: str
+    level: SharedLevel
+    audience: SharedLabel
     estimated_duration_minutes: PositiveInt = Field(
         ..., description="Approximate duration per lesson."
     )
@@ -118,8 +150,8 @@ class LessonPlanBundle(BaseModel):
     """Collection of lessons tied to a topic and learner level."""
 
     topic: str
-    level: LearnerLevel
-    audience: str
+    level: SharedLevel
+    audience: SharedLabel
     lessons: List[LessonPlan]
 
     @field_validator("lessons", mode="after")
@@ -127,4 +159,3 @@ class LessonPlanBundle(BaseModel):
         if not value:
             raise ValueError("Lesson bundles must include at least one lesson.")
         return value
-
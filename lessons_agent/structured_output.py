@@ -1,6 +1,7 @@
 """Structured output helpers for lesson generation."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.runnables import Runnable
@@ -9,6 +10,16 @@ from lessons_agent.schemas import LessonPlanBundle
 from tutorials.holistic_ai_bedrock import get_chat_model
 
 
+@lru_cache(maxsize=8)
+def _cached_lesson_plan_bundle_model(
+    model_name: str,
+    llm_kwargs: Tuple[Tuple[str, Any], ...],
+) -> Runnable:
+    return get_chat_model(model_name=model_name, **dict(llm_kwargs)).with_structured_output(
+        LessonPlanBundle
+    )
+
+
 def get_lesson_plan_bundle_model(
     *,
     llm: Optional[BaseChatModel] = None,
@@ -25,9 +36,17 @@ def get_lesson_plan_bundle_model(
 
     Returns:
         A Runnable that, when invoked, produces ``LessonPlanBundle`` objects that
-        conform to the schema defined in ``lessons_agent.schemas``.
+        conform to the schema defined in ``lessons_agent.schemas``. Runnables built
+        from ``model_name``/``llm_kwargs`` are cached and shared between callers.
     """
 
-    base_llm = llm or get_chat_model(model_name=model_name, **llm_kwargs)
-    return base_llm.with_structured_output(LessonPlanBundle)
-
+    if llm is not None:
+        return llm.with_structured_output(LessonPlanBundle)
+    cache_key = tuple(sorted(llm_kwargs.items()))
+    try:
+        hash(cache_key)
+    except TypeError:  # unhashable kwargs; build an uncached runnable
+        return get_chat_model(model_name=model_name, **llm_kwargs).with_structured_output(
+            LessonPlanBundle
+        )
+    return _cached_lesson_plan_bundle_model(model_name, cache_key)
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import os
-from dataclasses import dataclass
+import sqlite3
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -12,29 +15,174 @@ import requests
 from bs4 import BeautifulSoup
 from langchain_core.tools import tool
 from pypdf import PdfReader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from lessons_agent.monitoring import log_event
+from lessons_agent.serialization import loads
+
+try:
+    import lxml.html  # C-backed parser for BeautifulSoup and _strip_html_fast
+    from lxml import etree as lxml_etree
+
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - exercised only without lxml installed
+    lxml_etree = None  # type: ignore[assignment]
+    HTML_PARSER = "html.parser"
+
+try:
+    import pymupdf  # MuPDF bindings; much faster text extraction than pypdf
+except ImportError:  # pragma: no cover - exercised only without PyMuPDF installed
+    pymupdf = None  # type: ignore[assignment]
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - exercised only without diskcache installed
+    diskcache = None  # type: ignore[assignment]
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 RESOURCE_DIR = ROOT_DIR / "resources"
+HTTP_CACHE_DIR = Path.home() / ".cache" / "lessons_agent" / "http"
+HTTP_CACHE_TTL_SECONDS = 86400
+_HTTP_CACHE_ERRORS = (OSError, sqlite3.Error) + (
+    (diskcache.Timeout,) if diskcache is not None else ()
+)
+# Hard ceiling on bytes read per page. It is deliberately independent of max_chars:
+# inline <head> styles and scripts can outweigh a page's visible text many times over.
+FETCH_MAX_BYTES = 5_000_000
+
+
+@lru_cache(maxsize=1)
+def _http_cache() -> Optional[Any]:
+    """Return the on-disk response cache, or None when diskcache is missing or disabled.
+
+    Set ``LESSONS_AGENT_HTTP_CACHE=0`` to bypass it; call ``_http_cache.cache_clear()``
+    after changing the variable in-process.
+    """
+
+    if diskcache is None or os.getenv("LESSONS_AGENT_HTTP_CACHE", "1") == "0":
+        return None
+    try:
+        return diskcache.Cache(str(HTTP_CACHE_DIR))
+    except _HTTP_CACHE_ERRORS as exc:
+        # The cache is optional; an unusable directory must not block the request itself.
+        log_event("http_cache_disabled", reason=str(exc))
+        return None
+
+
+def _http_cache_key(*parts: Any) -> str:
+    return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def _http_cache_get(key: str) -> Any:
+    """Return the cached value for ``key``, or None on a miss or any cache failure."""
+
+    cache = _http_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except _HTTP_CACHE_ERRORS as exc:
+        log_event("http_cache_error", operation="get", error=str(exc))
+        return None
+
+
+def _http_cache_set(key: str, value: Any) -> None:
+    cache = _http_cache()
+    if cache is None:
+        return
+    try:
+        cache.set(key, value, expire=HTTP_CACHE_TTL_SECONDS)
+    except _HTTP_CACHE_ERRORS as exc:
+        log_event("http_cache_error", operation="set", error=str(exc))
+
+
+def _build_session() -> requests.Session:
+    """Return a keep-alive session with a bounded connection pool and connect retries."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by fetch_web_page so repeated fetches reuse TCP/TLS connections per host.
+_SESSION = _build_session()
+_SESSION.headers["User-Agent"] = "LessonsAgent/1.0"
 
 
 def _strip_html(html_text: str) -> str:
-    soup = BeautifulSoup(html_text, "html.parser")
+    soup = BeautifulSoup(html_text, HTML_PARSER)
     return " ".join(soup.stripped_strings)
 
 
+# Elements whose text BeautifulSoup's stripped_strings leaves out.
+_NON_TEXT_TAGS = ("script", "style", "template")
+_TEXT_NODES = lxml_etree.XPath("//text()") if lxml_etree is not None else None
+
+
+def _strip_html_fast(html_text: str) -> str:
+    """Produce ``_strip_html``'s output straight from lxml, without a BeautifulSoup tree."""
+
+    if lxml_etree is None:
+        return _strip_html(html_text)
+    try:
+        document = lxml.html.fromstring(html_text)
+    except (lxml_etree.ParserError, ValueError):
+        # Empty documents, or str input carrying an XML encoding declaration.
+        return _strip_html(html_text)
+    if document.tag in _NON_TEXT_TAGS:
+        return ""
+    lxml_etree.strip_elements(document, *_NON_TEXT_TAGS, with_tail=False)
+    return " ".join(text for text in (node.strip() for node in _TEXT_NODES(document)) if text)
+
+
 def _truncate(text: str, max_chars: int) -> str:
     if len(text) <= max_chars:
         return text
     return text[: max_chars - 3] + "..."
 
 
+def _valyu_result_from(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Map one raw Valyu DeepSearch result onto the tool's result shape."""
+
+    get = item.get
+    summary = get("summary") or get("snippet") or ""
+    if not summary and get("content"):
+        summary = _strip_html_fast(item["content"])
+    summary = summary.strip()
+    thumbnail_url = get("thumbnail_url") or get("thumbnailUrl")
+    title = get("title")
+    prompt_hint_source = get("image_prompt") or summary or title or ""
+    return {
+        "title": title or get("url"),
+        "url": get("url"),
+        "summary": summary,
+        "source": "valyu.ai",
+        "image_url": get("image_url") or get("imageUrl") or thumbnail_url,
+        "thumbnail_url": thumbnail_url,
+        "image_prompt_hint": _truncate(prompt_hint_source.strip(), 400),
+    }
+
+
 @dataclass
 class ValyuSearchClient:
     api_key: str
     base_url: str = "https://api.valyu.ai/v1"
     timeout: int = 30
+    session: requests.Session = field(
+        default_factory=_build_session, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.session.headers.update(
+            {"Content-Type": "application/json", "x-api-key": self.api_key}
+        )
 
     @classmethod
     def from_env(cls) -> "ValyuSearchClient":
@@ -45,58 +193,58 @@ class ValyuSearchClient:
         return cls(api_key=api_key, base_url=base_url.rstrip("/"))
 
     def search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        cache_key = _http_cache_key("valyu", self.base_url, query, max_results)
+        cached = _http_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        results = self._search_uncached(query, max_results)
+        _http_cache_set(cache_key, results)
+        return results
+
+    def _search_uncached(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         payload = {
             "query": query,
             "search_type": "all",
             "max_num_results": max_results,
             "is_tool_call": True,
         }
-        headers = {"Content-Type": "application/json", "x-api-key": self.api_key}
-        response = requests.post(
-            f"{self.base_url}/deepsearch", json=payload, headers=headers, timeout=self.timeout
+        response = self.session.post(
+            f"{self.base_url}/deepsearch", json=payload, timeout=self.timeout
         )
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:
             detail = ""
             with contextlib.suppress(ValueError):
-                detail = response.json().get("error", "")
+                detail = loads(response.content).get("error", "")
             raise requests.HTTPError(
                 f"Valyu search failed ({response.status_code}): {detail or response.text}"
             ) from exc
-        data = response.json()
+        data = loads(response.content)
         if not data.get("success", True):
             raise RuntimeError(f"Valyu search error: {data.get('error', 'unknown error')}")
-        results: List[Dict[str, Any]] = []
-        for item in data.get("results", []):
-            summary = item.get("summary") or item.get("snippet") or ""
-            if item.get("content"):
-                summary = summary or _strip_html(item["content"])
-            summary = summary.strip()
-            image_url = (
-                item.get("image_url")
-                or item.get("imageUrl")
-                or item.get("thumbnail_url")
-                or item.get("thumbnailUrl")
-            )
-            thumbnail_url = item.get("thumbnail_url") or item.get("thumbnailUrl")
-            prompt_hint_source = item.get("image_prompt") or summary or item.get("title") or ""
-            prompt_hint = _truncate(prompt_hint_source.strip(), 400) if prompt_hint_source else ""
-            results.append(
-                {
-                    "title": item.get("title") or item.get("url"),
-                    "url": item.get("url"),
-                    "summary": summary,
-                    "source": "valyu.ai",
-                    "image_url": image_url,
-                    "thumbnail_url": thumbnail_url,
-                    "image_prompt_hint": prompt_hint,
-                }
-            )
-        return results
+        return [_valyu_result_from(item) for item in data.get("results", [])]
+
+
+@lru_cache(maxsize=1)
+def _get_valyu_client() -> ValyuSearchClient:
+    """Return a process-wide client so its pooled session outlives single tool calls.
 
+    Call ``_get_valyu_client.cache_clear()`` after changing ``VALYU_API_KEY`` or
+    ``VALYU_API_BASE_URL``; a missing key raises and is not cached.
+    """
 
+    return ValyuSearchClient.from_env()
+
+
+@lru_cache(maxsize=256)
 def _resolve_path(path: str) -> Path:
+    """Resolve ``path`` against the repo root, then ``resources/``.
+
+    Hits are memoized to spare repeated ``stat`` calls inside a ReAct loop; misses raise
+    and are therefore never cached. Call ``_resolve_path.cache_clear()`` after moving files.
+    """
+
     candidate = Path(path).expanduser()
     if candidate.is_absolute():
         return candidate
@@ -110,6 +258,10 @@ def _resolve_path(path: str) -> Path:
 
 
 def _load_pdf(path: Path) -> str:
+    if pymupdf is not None:
+        with pymupdf.open(path) as document:
+            texts = [page.get_text("text").strip() for page in document]
+        return "\n\n".join(filter(None, texts))
     with path.open("rb") as file:
         reader = PdfReader(file)
         texts: List[str] = []
@@ -141,6 +293,24 @@ def _load_document_content(resolved_path: Path) -> Dict[str, Any]:
     }
 
 
+def _download_html(url: str, byte_limit: int) -> str:
+    """Stream ``url`` and stop reading once ``byte_limit`` bytes have arrived."""
+
+    response = _SESSION.get(url, timeout=30, stream=True)
+    try:
+        response.raise_for_status()
+        chunks: List[bytes] = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=8192):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= byte_limit:
+                break
+    finally:
+        response.close()
+    return b"".join(chunks).decode(response.encoding or "utf-8", errors="ignore")
+
+
 @tool("valyu_web_search", return_direct=False)
 def valyu_web_search(query: str, max_results: int = 5) -> Dict[str, Any]:
     """Search the web using Valyu.ai and return high-signal snippets (max_results <= 10)."""
@@ -149,7 +319,7 @@ def valyu_web_search(query: str, max_results: int = 5) -> Dict[str, Any]:
         raise ValueError("query must be provided.")
     max_results = max(1, min(max_results, 10))
     log_event("valyu_web_search_start", query=query, max_results=max_results)
-    client = ValyuSearchClient.from_env()
+    client = _get_valyu_client()
     items = client.search(query=query, max_results=max_results)
     log_event("valyu_web_search_complete", results=len(items))
     return {"query": query, "results": items}
@@ -162,9 +332,11 @@ def fetch_web_page(url: str, max_chars: int = 6000) -> Dict[str, Any]:
     if not url:
         raise ValueError("url must be provided.")
     log_event("fetch_web_page_start", url=url)
-    response = requests.get(url, timeout=30, headers={"User-Agent": "LessonsAgent/1.0"})
-    response.raise_for_status()
-    text = _strip_html(response.text)
+    cache_key = _http_cache_key("fetch", url)
+    text = _http_cache_get(cache_key)
+    if text is None:
+        text = _strip_html_fast(_download_html(url, FETCH_MAX_BYTES))
+        _http_cache_set(cache_key, text)
     content = _truncate(text, max_chars)
     log_event("fetch_web_page_complete", url=url, chars=len(content))
     return {"url": url, "content": content}
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from lessons_agent.pipeline import LessonGenerationConfig, generate_lessons_to_disk
@@ -26,11 +27,16 @@ def main():
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for topic, level in BENCHMARK_TOPICS:
-        config = LessonGenerationConfig(topic=topic, level=level, num_lessons=1)
-        log_event("benchmark_topic_start", topic=topic)
-        infos = generate_lessons_to_disk(config, output_dir=output_dir)
-        log_event("benchmark_topic_complete", topic=topic, files=len(infos))
+    # Each topic is dominated by network waits, so run them side by side.
+    with ThreadPoolExecutor(max_workers=len(BENCHMARK_TOPICS)) as executor:
+        futures = {}
+        for topic, level in BENCHMARK_TOPICS:
+            config = LessonGenerationConfig(topic=topic, level=level, num_lessons=1)
+            log_event("benchmark_topic_start", topic=topic)
+            futures[executor.submit(generate_lessons_to_disk, config, output_dir=output_dir)] = topic
+        for future in as_completed(futures):
+            infos = future.result()
+            log_event("benchmark_topic_complete", topic=futures[future], files=len(infos))
 
 
 if __name__ == "__main__":
@@ -72,8 +72,18 @@ def test_fallback_research_summary_is_tool_agnostic(mock_client):
     assert citations == ["https://example.com/a", "https://example.com/b"]
 
 
+def test_research_notes_accept_non_exact_str_labels():
+    class Label(str):
+        pass
+
+    notes = ResearchNotes(topic="t", level=None, audience=Label("devs"))
+    assert notes.level is None
+    assert notes.audience == "devs"
+
+
 if __name__ == "__main__":
     test_build_research_agent_executor_wires_prompt()
     test_run_research_agent_collects_notes()
+    test_research_notes_accept_non_exact_str_labels()
     print("All Task 4 tests passed.")
 
@@ -5,11 +5,24 @@ from __future__ import annotations
 import os
 from unittest import mock
 
+import pytest
+
 from lessons_agent.config import reload_llm_settings
-from lessons_agent.llm import get_default_chat_model, get_structured_output_model
+from lessons_agent.llm import (
+    clear_chat_model_cache,
+    get_default_chat_model,
+    get_structured_output_model,
+)
 from lessons_agent.schemas import LessonPlanBundle
 
 
+@pytest.fixture(autouse=True)
+def _fresh_chat_model_cache():
+    clear_chat_model_cache()
+    yield
+    clear_chat_model_cache()
+
+
 def _reset_env_var(key: str, original_value: str | None) -> None:
     if original_value is None:
         os.environ.pop(key, None)
@@ -61,6 +74,21 @@ def test_environment_override_affects_model_settings() -> None:
         _reset_env_var(env_key, original_value)
 
 
+def test_default_chat_model_is_reused_for_same_config() -> None:
+    with mock.patch(
+        "lessons_agent.llm.get_chat_model", autospec=True
+    ) as mock_get_chat_model:
+        mock_get_chat_model.side_effect = lambda **_: mock.Mock()
+
+        first = get_default_chat_model()
+        second = get_default_chat_model()
+        overridden = get_default_chat_model(overrides={"temperature": 0.9})
+
+    assert first is second
+    assert overridden is not first
+    assert mock_get_chat_model.call_count == 2
+
+
 def test_structured_output_helper() -> None:
     mock_model = mock.Mock()
     mock_runnable = mock.Mock()
@@ -78,6 +106,9 @@ def test_structured_output_helper() -> None:
 if __name__ == "__main__":
     test_get_default_chat_model_uses_defaults()
     test_environment_override_affects_model_settings()
+    clear_chat_model_cache()
+    test_default_chat_model_is_reused_for_same_config()
+    clear_chat_model_cache()
     test_structured_output_helper()
     print("All Task 2 tests passed.")
 
@@ -22,6 +22,26 @@ def test_log_event_writes_json(capfd=None):
         logger.info.assert_called_once()
 
 
+def test_log_event_skips_serialization_when_info_disabled():
+    configure_logging()
+    with mock.patch("lessons_agent.monitoring.LOGGER") as logger, mock.patch(
+        "lessons_agent.monitoring.dumps_str"
+    ) as mock_dumps:
+        logger.isEnabledFor.return_value = False
+        log_event("test_event", foo="bar")
+    logger.info.assert_not_called()
+    mock_dumps.assert_not_called()
+
+
+def test_log_event_accepts_payloads_orjson_rejects():
+    configure_logging()
+    with mock.patch("lessons_agent.monitoring.LOGGER") as logger:
+        logger.isEnabledFor.return_value = True
+        log_event("test_event", counts={1: 2}, n=2**70)
+    message = logger.info.call_args.args[1]
+    assert message == f'{{"event":"test_event","counts":{{"1":2}},"n":{2**70}}}'
+
+
 def test_validate_lesson_bundle_requires_sources():
     block = ContentBlock(type="text", text="content")
     section = LessonSection(
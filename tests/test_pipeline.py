@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import tempfile
+import threading
 from pathlib import Path
 from unittest import mock
 
 from lessons_agent.agent import ResearchAgentConfig, ResearchNotes
 from lessons_agent.pipeline import (
+    SYNTHESIS_PROMPT_PREFIX,
     LessonGenerationConfig,
     LessonGenerationResult,
+    _build_synthesis_prompt,
     _clean_summary_text,
+    _invoke_synthesis_with_retries,
     _normalize_bundle,
     generate_lessons,
     generate_lessons_to_disk,
@@ -118,6 +122,106 @@ def test_generate_lessons_runs_research_and_synthesis(mock_client):
     )
 
 
+@mock.patch("lessons_agent.pipeline.ValyuSearchClient")
+def test_image_search_overlaps_research(mock_client):
+    search_started = threading.Event()
+
+    def _search(**_kwargs):
+        search_started.set()
+        return [{"title": "Visual", "url": "https://example.com/v", "summary": "Diagram."}]
+
+    mock_client.from_env.return_value.search.side_effect = _search
+
+    def _research(research_config):
+        assert search_started.wait(timeout=5), "image search should start before research ends"
+        notes = ResearchNotes(topic=research_config.topic, level="beginner", audience="devs")
+        notes.add_entry("Finding A", ["https://example.com"])
+        return notes
+
+    structured_mock = mock.Mock()
+    structured_mock.invoke.return_value = _mock_bundle()
+    config = LessonGenerationConfig(
+        topic="LangChain", level="beginner", prefetch_image_search=True
+    )
+
+    result = generate_lessons(config, research_runner=_research, structured_runner=structured_mock)
+
+    assert any(
+        block.type == "image"
+        for block in result.bundle.lessons[0].sections[0].content_blocks
+    )
+    mock_client.from_env.return_value.search.assert_called_once()
+
+
+@mock.patch("lessons_agent.pipeline.ValyuSearchClient")
+def test_image_search_skipped_when_synthesis_supplies_images(mock_client):
+    bundle = _mock_bundle()
+    bundle.lessons[0].sections[0].content_blocks.append(
+        ContentBlock(type="image", image_prompt="Diagram of the flow")
+    )
+    structured_mock = mock.Mock()
+    structured_mock.invoke.return_value = bundle
+    notes = ResearchNotes(topic="LangChain", level="beginner", audience="devs")
+    notes.add_entry("Finding A", ["https://example.com"])
+
+    generate_lessons(
+        LessonGenerationConfig(topic="LangChain", level="beginner"),
+        research_runner=mock.Mock(return_value=notes),
+        structured_runner=structured_mock,
+    )
+
+    mock_client.from_env.return_value.search.assert_not_called()
+
+
+def test_speculative_retry_returns_first_successful_attempt():
+    release_first = threading.Event()
+    bundle = _mock_bundle()
+
+    class SlowThenFastRunner:
+        def __init__(self):
+            self.prompts = []
+
+        def invoke(self, prompt):
+            self.prompts.append(prompt)
+            if len(self.prompts) == 1:
+                release_first.wait(timeout=5)
+                raise ValueError("schema mismatch")
+            return bundle
+
+    runner = SlowThenFastRunner()
+    try:
+        result = _invoke_synthesis_with_retries(runner, "prompt", speculative_after=0.01)
+    finally:
+        release_first.set()
+
+    assert result is bundle
+    assert len(runner.prompts) == 2
+    assert "STRICT SCHEMA REMINDER" in runner.prompts[1]
+
+
+def test_synthesis_prompt_requests_all_lessons_in_one_call():
+    notes = ResearchNotes(topic="LangChain", level="beginner", audience="devs")
+    notes.add_entry("Finding A", ["https://example.com"])
+    config = LessonGenerationConfig(topic="LangChain", level="beginner", num_lessons=3)
+
+    prompt = _build_synthesis_prompt(config, notes)
+
+    for idx in range(1, 4):
+        assert f"Lesson {idx} of 3" in prompt
+    assert "Lesson 4 of 3" not in prompt
+
+
+def test_synthesis_prompt_keeps_static_text_in_shared_prefix():
+    notes = ResearchNotes(topic="LangChain", level="beginner", audience="devs")
+    notes.add_entry("Finding A", ["https://example.com"])
+    config = LessonGenerationConfig(topic="LangChain", level="beginner")
+
+    prompt = _build_synthesis_prompt(config, notes)
+
+    assert prompt.startswith(SYNTHESIS_PROMPT_PREFIX)
+    assert "LangChain" not in SYNTHESIS_PROMPT_PREFIX
+
+
 def test_clean_summary_text_removes_navigation_noise():
     noisy = "Home Pricing Docs\nRAG best practices require clean context windows and trustworthy sources."
     cleaned = _clean_summary_text(noisy)
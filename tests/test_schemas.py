@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import json
 from typing import Any, List, Optional
+from unittest import mock
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage
 from langchain_core.outputs import ChatGeneration, ChatResult
 from langchain_core.runnables import RunnableLambda
+from pydantic import ValidationError
 
 from lessons_agent.schemas import (
     ContentBlock,
@@ -18,6 +20,7 @@ from lessons_agent.schemas import (
     ReferenceResource,
     SourceCitation,
 )
+from lessons_agent import structured_output
 from lessons_agent.structured_output import get_lesson_plan_bundle_model
 
 
@@ -103,6 +106,26 @@ def test_schema_round_trip() -> None:
     assert restored.lessons[0].sections[0].content_blocks[0].text == "Explain what LangChain is."
 
 
+def test_content_block_rejects_empty_payload_for_its_type() -> None:
+    """Explicitly empty text/image_prompt fail; omitted ones are filled in later."""
+
+    for payload in ({"type": "text", "text": ""}, {"type": "image", "image_prompt": None}):
+        try:
+            ContentBlock(**payload)
+            assert False, f"Expected validation error for {payload}"
+        except ValidationError:
+            pass
+    assert ContentBlock(type="image").image_prompt is None
+
+
+def test_urls_are_kept_as_strings_and_non_http_values_dropped() -> None:
+    resource = ReferenceResource(title="Docs", type="documentation", url="https://python.langchain.com")
+    assert resource.url == "https://python.langchain.com"
+    assert ReferenceResource(title="Docs", type="other", url="ftp://example.com").url is None
+    block = ContentBlock(type="image", image_prompt="Diagram", image_url="not a url")
+    assert block.image_url is None
+
+
 def test_structured_output_helper_returns_bundle() -> None:
     """Verify the helper produces LessonPlanBundle objects via structured output."""
 
@@ -115,8 +138,40 @@ def test_structured_output_helper_returns_bundle() -> None:
     assert result.lessons[0].learning_objectives == ["Understand LangChain's purpose"]
 
 
+def test_structured_output_helper_reuses_bound_runnable() -> None:
+    structured_output._cached_lesson_plan_bundle_model.cache_clear()
+    fake_llm = mock.Mock()
+    with mock.patch.object(
+        structured_output, "get_chat_model", return_value=fake_llm
+    ) as mock_get_chat_model:
+        first = get_lesson_plan_bundle_model(temperature=0.1)
+        second = get_lesson_plan_bundle_model(temperature=0.1)
+    structured_output._cached_lesson_plan_bundle_model.cache_clear()
+
+    assert first is second
+    mock_get_chat_model.assert_called_once_with(model_name="claude-3-5-sonnet", temperature=0.1)
+    fake_llm.with_structured_output.assert_called_once_with(LessonPlanBundle)
+
+
+def test_structured_output_helper_builds_once_when_model_raises_type_error() -> None:
+    structured_output._cached_lesson_plan_bundle_model.cache_clear()
+    with mock.patch.object(
+        structured_output, "get_chat_model", side_effect=TypeError("bad kwarg")
+    ) as mock_get_chat_model:
+        try:
+            get_lesson_plan_bundle_model(not_a_real_option=True)
+            assert False, "Expected the TypeError from get_chat_model to propagate"
+        except TypeError:
+            pass
+    structured_output._cached_lesson_plan_bundle_model.cache_clear()
+
+    mock_get_chat_model.assert_called_once()
+
+
 if __name__ == "__main__":
     test_schema_round_trip()
     test_structured_output_helper_returns_bundle()
+    test_structured_output_helper_reuses_bound_runnable()
+    test_structured_output_helper_builds_once_when_model_raises_type_error()
     print("All Task 1 tests passed.")
 
@@ -0,0 +1,59 @@
+"""Tests for the JSON serialization helpers."""
+
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from lessons_agent import serialization
+from lessons_agent.schemas import SourceCitation
+
+
+def test_dumps_indents_and_encodes_utf8():
+    payload = {"topic": "Café", "lessons": [1, 2]}
+    encoded = serialization.dumps(payload, indent=True)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == payload
+    assert "Café".encode("utf-8") in encoded
+    assert b'\n  "topic"' in encoded
+
+
+def test_dumps_falls_back_to_stdlib_without_orjson():
+    payload = {"event": "test", "value": object()}
+    with mock.patch.object(serialization, "orjson", None):
+        text = serialization.dumps_str(payload, default=str)
+    assert json.loads(text)["event"] == "test"
+
+
+def test_dump_model_matches_with_and_without_orjson():
+    citation = SourceCitation(source_id="https://example.com", description="Résumé")
+    fast = serialization.dump_model(citation, indent=True)
+    with mock.patch.object(serialization, "orjson", None):
+        fallback = serialization.dump_model(citation, indent=True)
+    assert fast == fallback
+
+
+def test_dumps_str_handles_non_str_keys_and_big_ints():
+    payload = {"counts": {1: 2}, "n": 2**70}
+    assert serialization.dumps_str(payload, default=str) == f'{{"counts":{{"1":2}},"n":{2**70}}}'
+    assert serialization.dumps_str({"a": 1}) == '{"a":1}'
+
+
+def test_loads_accepts_bytes_and_raises_value_error():
+    raw = '{"results": [{"title": "Café"}]}'.encode("utf-8")
+    with mock.patch.object(serialization, "orjson", None):
+        fallback = serialization.loads(raw)
+    assert serialization.loads(raw) == fallback == {"results": [{"title": "Café"}]}
+    with pytest.raises(ValueError):
+        serialization.loads(b"<html>")
+
+
+if __name__ == "__main__":
+    test_dumps_indents_and_encodes_utf8()
+    test_dumps_falls_back_to_stdlib_without_orjson()
+    test_dump_model_matches_with_and_without_orjson()
+    test_dumps_str_handles_non_str_keys_and_big_ints()
+    test_loads_accepts_bytes_and_raises_value_error()
+    print("Serialization tests passed.")
@@ -3,22 +3,46 @@
 from __future__ import annotations
 
 import os
+import sqlite3
 from pathlib import Path
 from typing import Any, Dict
 from unittest import mock
 
+import pytest
+
 from lessons_agent import tools
+from lessons_agent.serialization import dumps
+
+
+# Applied to each test that mocks HTTP, so cached fakes never reach the real cache dir
+# whether the tests run under pytest or via this module's __main__ block.
+_no_http_cache = mock.patch("lessons_agent.tools._http_cache", new=lambda: None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_tool_caches() -> Any:
+    tools._http_cache.cache_clear()
+    tools._get_valyu_client.cache_clear()
+    tools._resolve_path.cache_clear()
+    yield
+    tools._http_cache.cache_clear()
+    tools._get_valyu_client.cache_clear()
+    tools._resolve_path.cache_clear()
 
 
 def _mock_response(json_payload: Dict[str, Any]) -> mock.Mock:
     response = mock.Mock()
     response.json.return_value = json_payload
+    response.content = dumps(json_payload)
     response.raise_for_status = mock.Mock()
     response.text = "<html><body>Hello world</body></html>"
+    response.encoding = "utf-8"
+    response.iter_content.side_effect = lambda **_: iter([response.text.encode("utf-8")])
     return response
 
 
-@mock.patch("lessons_agent.tools.requests.post")
+@_no_http_cache
+@mock.patch("lessons_agent.tools.requests.Session.post")
 def test_valyu_web_search_tool(mock_post: mock.Mock) -> None:
     os.environ["VALYU_API_KEY"] = "test-key"
     mock_post.return_value = _mock_response(
@@ -43,7 +67,8 @@ def test_valyu_web_search_tool(mock_post: mock.Mock) -> None:
     mock_post.assert_called_once()
 
 
-@mock.patch("lessons_agent.tools.requests.get")
+@_no_http_cache
+@mock.patch("lessons_agent.tools._SESSION.get")
 def test_fetch_web_page_tool(mock_get: mock.Mock) -> None:
     mock_resp = _mock_response({})
     mock_resp.text = "<html><head><title>Test</title></head><body><p>Body text</p></body></html>"
@@ -54,6 +79,148 @@ def test_fetch_web_page_tool(mock_get: mock.Mock) -> None:
     mock_get.assert_called_once()
 
 
+def test_valyu_tool_reuses_one_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VALYU_API_KEY", "test-key")
+    assert tools._get_valyu_client() is tools._get_valyu_client()
+
+
+def test_valyu_client_presets_auth_headers_on_its_session() -> None:
+    client = tools.ValyuSearchClient(api_key="secret")
+    assert client.session.headers["x-api-key"] == "secret"
+    assert client.session.headers["Content-Type"] == "application/json"
+    assert "session=" not in repr(client)
+
+
+@mock.patch("lessons_agent.tools._SESSION.get")
+def test_fetch_web_page_reuses_cached_text(
+    mock_get: mock.Mock, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pytest.importorskip("diskcache")
+    monkeypatch.setenv("LESSONS_AGENT_HTTP_CACHE", "1")
+    monkeypatch.setattr(tools, "HTTP_CACHE_DIR", tmp_path)
+    tools._http_cache.cache_clear()
+    mock_get.return_value = _mock_response({})
+    first = tools.fetch_web_page.invoke({"url": "https://example.com/page"})
+    second = tools.fetch_web_page.invoke({"url": "https://example.com/page"})
+    assert first["content"] == second["content"] == "Hello world"
+    mock_get.assert_called_once()
+    tools._http_cache().close()
+
+
+@mock.patch("lessons_agent.tools.requests.Session.post")
+def test_valyu_search_reuses_cached_results(
+    mock_post: mock.Mock, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pytest.importorskip("diskcache")
+    monkeypatch.setenv("LESSONS_AGENT_HTTP_CACHE", "1")
+    monkeypatch.setattr(tools, "HTTP_CACHE_DIR", tmp_path)
+    tools._http_cache.cache_clear()
+    mock_post.return_value = _mock_response(
+        {"results": [{"title": "Result A", "url": "https://example.com/a", "summary": "A"}]}
+    )
+    client = tools.ValyuSearchClient(api_key="test-key")
+    first = client.search("langchain", max_results=3)
+    second = client.search("langchain", max_results=3)
+    client.search("langchain", max_results=4)
+    assert first == second
+    assert first[0]["title"] == "Result A"
+    assert mock_post.call_count == 2
+    tools._http_cache().close()
+
+
+@mock.patch("lessons_agent.tools.requests.Session.post")
+def test_valyu_search_posts_when_cache_dir_is_unusable(
+    mock_post: mock.Mock, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pytest.importorskip("diskcache")
+    not_a_dir = tmp_path / "notadir"
+    not_a_dir.write_text("occupied")
+    monkeypatch.setenv("LESSONS_AGENT_HTTP_CACHE", "1")
+    monkeypatch.setattr(tools, "HTTP_CACHE_DIR", not_a_dir / "http")
+    tools._http_cache.cache_clear()
+    mock_post.return_value = _mock_response({"results": [{"title": "A", "url": "https://a"}]})
+    results = tools.ValyuSearchClient(api_key="k").search("q")
+    assert tools._http_cache() is None
+    assert results[0]["title"] == "A"
+    mock_post.assert_called_once()
+
+
+@mock.patch("lessons_agent.tools._SESSION.get")
+def test_fetch_web_page_falls_through_cache_errors(mock_get: mock.Mock) -> None:
+    broken_cache = mock.Mock()
+    broken_cache.get.side_effect = sqlite3.OperationalError("database is locked")
+    broken_cache.set.side_effect = sqlite3.OperationalError("database is locked")
+    mock_get.return_value = _mock_response({})
+    with mock.patch("lessons_agent.tools._http_cache", new=lambda: broken_cache):
+        payload = tools.fetch_web_page.invoke({"url": "https://example.com"})
+    assert payload["content"] == "Hello world"
+    mock_get.assert_called_once()
+    broken_cache.set.assert_called_once()
+
+
+@_no_http_cache
+@mock.patch("lessons_agent.tools._SESSION.get")
+def test_fetch_web_page_reads_past_heavy_head_markup(mock_get: mock.Mock) -> None:
+    stylesheet = "".join(f".rule-{idx} {{ color: #{idx:06x}; }}\n" for idx in range(2500))
+    page = f"<html><head><style>{stylesheet}</style></head><body><p>Body text</p></body></html>"
+    encoded = page.encode("utf-8")
+    assert len(encoded) > 70_000
+    response = _mock_response({})
+    response.iter_content.side_effect = lambda **_: (
+        encoded[start : start + 8192] for start in range(0, len(encoded), 8192)
+    )
+    mock_get.return_value = response
+    result = tools.fetch_web_page.invoke({"url": "https://example.com/styled"})
+    assert result["content"] == "Body text"
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert tools._SESSION.headers["User-Agent"] == "LessonsAgent/1.0"
+    response.close.assert_called_once()
+
+
+@_no_http_cache
+@mock.patch("lessons_agent.tools._SESSION.get")
+def test_fetch_web_page_caps_bytes_regardless_of_max_chars(
+    mock_get: mock.Mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tools, "FETCH_MAX_BYTES", 8192)
+    response = _mock_response({})
+    body = iter([b"<p>" + b"a" * 8192, b"b" * 8192 + b"</p>"])
+    response.iter_content.side_effect = lambda **_: body
+    mock_get.return_value = response
+    result = tools.fetch_web_page.invoke({"url": "https://example.com/huge", "max_chars": 10**9})
+    assert "b" not in result["content"]
+    assert next(body).startswith(b"b")
+
+
+@pytest.mark.parametrize(
+    "html_text",
+    [
+        "<html><head><title>T</title><style>a{}</style></head>"
+        "<body><p>Body  text</p><!-- note --><b>Hi</b>there<script>x=1</script></body></html>",
+        "<template>hidden</template>",
+        "",
+        "<?xml version='1.0' encoding='utf-8'?><html><body>x</body></html>",
+    ],
+)
+def test_strip_html_fast_matches_beautifulsoup(html_text: str) -> None:
+    assert tools._strip_html_fast(html_text) == tools._strip_html(html_text)
+
+
+def test_resolve_path_caches_hits_but_not_misses() -> None:
+    assert tools._resolve_path("api-guide.pdf") == tools.RESOURCE_DIR / "api-guide.pdf"
+    tools._resolve_path("api-guide.pdf")
+    with pytest.raises(FileNotFoundError):
+        tools._resolve_path("missing-guide.pdf")
+    info = tools._resolve_path.cache_info()
+    assert (info.hits, info.currsize) == (1, 1)
+
+
+def test_load_pdf_falls_back_to_pypdf(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "pymupdf", None)
+    text = tools._load_pdf(tools.RESOURCE_DIR / "api-guide.pdf")
+    assert len(text) > 0
+
+
 def test_load_local_resource_markdown() -> None:
     relative_path = "resources/TRACK_A_RESOURCES.md"
     result = tools.load_local_resource.invoke({"path": relative_path})